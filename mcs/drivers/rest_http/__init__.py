@@ -1 +1,8 @@
-from .rest_http_driver import RestHttpDriver
\ No newline at end of file
+from .rest_http_driver import RestHttpDriver
+
+# the async driver needs the optional httpx dependency
+try:
+    from .async_rest_http_driver import AsyncRestHttpDriver
+except ModuleNotFoundError as e:
+    if e.name != "httpx":
+        raise
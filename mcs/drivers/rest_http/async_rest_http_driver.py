@@ -0,0 +1,127 @@
+"""
+Async variant of the HTTP reference driver for the Model Context Standard (MCS).
+
+* Same discovery, overrides and spec handling as :class:`RestHttpDriver`
+* Executes tool calls through one pooled ``httpx.AsyncClient`` (HTTP/2 when
+  ``h2`` is installed, else HTTP/1.1)
+* ``process_llm_response`` is a coroutine; every tool call found in one LLM
+  response is dispatched concurrently
+
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Any, Dict
+
+import httpx
+
+from .rest_http_driver import RestHttpDriver, _JSON_DECODER, _iter_json_objects, _overrides_auth
+
+# httpx only imports h2 on the first HTTP/2 request; without it, stay on HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+# --------------------------------------------------------------------------- #
+#                               Driver                                        #
+# --------------------------------------------------------------------------- #
+class AsyncRestHttpDriver(RestHttpDriver):
+    """REST over HTTP with an async tool-call path.
+
+    Spec discovery (``get_function_description`` / ``get_driver_system_message``)
+    stays synchronous as required by :class:`MCSDriver` and is cached after the
+    first fetch. Only tool execution is async.
+
+    Use it as ``async with AsyncRestHttpDriver(urls) as driver: ...`` or call
+    :meth:`aclose` when done.
+    """
+
+    # ----------------------------- Init ----------------------------------- #
+    def __init__(self, urls: list[str], **kwargs: Any) -> None:
+        super().__init__(urls, **kwargs)
+        self._client: httpx.AsyncClient | None = None
+
+    # ----------------------------- Client --------------------------------- #
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=_HTTP2,
+            verify=self.verify_ssl,
+            proxy=self.proxies["https"] if self.proxies else None,
+            headers=self.default_headers,
+            auth=self._basic_auth,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+
+    async def __aenter__(self) -> AsyncRestHttpDriver:
+        if self._client is None:
+            self._client = self._build_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async client and the discovery session."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._session.close()
+
+    # --------------------------- Helpers ---------------------------------- #
+    async def _do_request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Dict[str, Any] | None = None,
+        json_body: Dict[str, Any] | None = None,
+        headers: Dict[str, str] | None = None,
+    ) -> str:
+        if self._client is None:
+            self._client = self._build_client()
+        resp = await self._client.request(
+            method.upper(),
+            url,
+            params=params,
+            json=json_body,
+            headers=headers or None,
+            # a per-call Authorization header wins over the client's basic auth
+            auth=None if _overrides_auth(headers) else httpx.USE_CLIENT_DEFAULT,
+        )
+        resp.raise_for_status()
+        return resp.text
+
+    def _parse_calls(self, llm_response: str) -> list[dict[str, Any]]:
+        """Return every tool call in the LLM response, in order."""
+        calls = []
+        for block in _iter_json_objects(llm_response):
+            try:
+                call = _JSON_DECODER.decode(block)
+            except ValueError:
+                continue
+            if call.get("path"):
+                calls.append(call)
+        return calls
+
+    async def _dispatch(self, call: dict[str, Any]) -> str:
+        method, url, kwargs = self._prepare_call(call)
+        return await self._do_request_async(method, url, **kwargs)
+
+    # --------------------------- Interface Implementation --------------------------------- #
+    async def process_llm_response(self, llm_response: str) -> str:  # type: ignore[override]
+        """Execute all tool calls in the LLM response concurrently.
+
+        Results are returned in call order, joined by newlines; a response
+        without any tool call is returned unchanged.
+        """
+        calls = self._parse_calls(llm_response)
+        if not calls:
+            return llm_response  # treat as plain text
+
+        if self._base_url is None:
+            # may need a (blocking) spec fetch; keep it off the event loop
+            await asyncio.to_thread(self._resolve_base_url)
+
+        results = await asyncio.gather(*(self._dispatch(call) for call in calls))
+        return "\n".join(results)
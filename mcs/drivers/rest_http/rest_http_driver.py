@@ -3,6 +3,7 @@ HTTP-based reference driver for the Model Context Standard (MCS).
 
 * Fetches an OpenAPI (or any JSON) spec via HTTP/HTTPS
 * Executes structured REST calls (GET/POST) emitted by an LLM
+* Reuses one pooled keep-alive session (with retries on 502/503/504)
 * Optional proxy, basic-auth, custom headers, SSL toggle
 * Supports developer overrides for
   - custom tool description
@@ -11,18 +12,92 @@ HTTP-based reference driver for the Model Context Standard (MCS).
 """
 from __future__ import annotations
 
-import base64
+import io
 import json
 import logging
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin, urlparse
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from mcs.drivers import MCSDriver, DriverMeta  # noqa: F401
 
+# orjson is an optional speed-up for spec documents; both decoders raise a
+# ValueError subclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_compact(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:  # integer wider than 64 bits (from a stdlib/ijson parse)
+            return _dumps_compact(obj)
+else:
+    _dumps = _dumps_compact
+
+
+# orjson loads integers wider than 64 bits as floats. Candidates are digit runs
+# of 19+ right after ':', ',' or '[' (whitespace removed); translate + find keep
+# the check at C speed (~5 ms for 3 MB, a regex scan takes ~35 ms).
+_NUMBER_CLASSES = bytes(
+    0x30 if 0x30 <= b <= 0x39 else 0x3A if b in b":,[" else b if b == 0x2D else 0x78
+    for b in range(256)
+)
+_WIDE_RUN = b"0" * 19
+
+
+def _has_wide_int(data: bytes) -> bool:
+    classes = data.translate(_NUMBER_CLASSES, b" \t\r\n")
+    return b":" + _WIDE_RUN in classes or b":-" + _WIDE_RUN in classes
+
+
+def _parse_spec(data: bytes) -> Any:
+    """Parse a spec body with orjson when that is lossless, else with the stdlib."""
+    if orjson is not None and not _has_wide_int(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ijson lets _load_spec prune specs while tokenizing them. That saves peak
+# memory but is slower than a DOM parse, so it is only used without orjson.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# patterns used by RestHttpDriver._extract_json on every LLM response
+_FENCE_OPEN = re.compile(r"^```[^\n]*\n")
+_FENCE_CLOSE = re.compile(r"\n```$")
+# structural tokens for _iter_json_objects; escapes are consumed as a pair
+_JSON_TOKEN = re.compile(r'[{}"]|\\.', re.S)
+# fast path for replies that are a bare JSON object: skip leading whitespace
+# without copying, then decode the first object in place
+_LEADING_WS = re.compile(r"[ \t\r\n]*")
+# tool calls are always decoded by the stdlib, which keeps wide integers exact
+_JSON_DECODER = json.JSONDecoder()
+
+# static parts of the default system prompt; only the description varies
+_SYSMSG_PREFIX = "You are a helpful assistant with access to these tools:\n\n"
+_SYSMSG_SUFFIX = (
+    "\n\n"
+    "When you need a tool, respond ONLY with JSON:\n"
+    '{ "path": "...", "arguments": { ... } }\n'
+)
+
 
 # --------------------------------------------------------------------------- #
 #                               Metadata                                      #
@@ -36,6 +111,113 @@ class _RestHttpMeta(DriverMeta):
     target_llms: tuple[str, ...] = ("*",)  # generic prompt works everywhere
 
 
+def _iter_json_objects(s: str) -> Iterator[str]:
+    """Yield every top-level balanced ``{...}`` block in *s*, in order.
+
+    Single linear pass that only visits braces, quotes and escapes, so braces
+    inside string literals are ignored and nothing backtracks. Text between
+    objects is skipped.
+    """
+    pos = s.find("{")
+    if pos < 0:
+        return
+
+    start = pos
+    depth = 0
+    in_str = False
+    for match in _JSON_TOKEN.finditer(s, pos):
+        token = match.group()
+        if depth == 0:
+            if token == "{":
+                start = match.start()
+                depth = 1
+            continue
+        if token == '"':
+            in_str = not in_str
+        elif in_str:
+            continue
+        elif token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                yield s[start:match.end()]
+
+
+def _find_first_json_object(s: str) -> str | None:
+    """Return the first balanced ``{...}`` block in *s*, or None."""
+    return next(_iter_json_objects(s), None)
+
+
+def _overrides_auth(headers: Dict[str, str] | None) -> bool:
+    """True if per-call *headers* carry their own Authorization header."""
+    return bool(headers) and any(key.lower() == "authorization" for key in headers)
+
+
+def _keep_response(code: Any) -> bool:
+    """True for response keys starting with 2 or 3 (``"200"``, ``"2XX"``, ...).
+
+    Plain three-digit codes take an integer range check; everything else keeps
+    the leading-character test, so both give the same answer for any key.
+    """
+    if not isinstance(code, str):
+        code = str(code)
+    if len(code) == 3 and code.isascii() and code.isdigit():
+        return 200 <= int(code) < 400
+    return code[:1] in ("2", "3")
+
+
+def _as_text(data: str | bytes) -> str:
+    """Decode a spec body to str; JSON is UTF-8 by definition (RFC 8259)."""
+    return data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+
+
+def _prune_spec_events(events: Any) -> Any:
+    """Rebuild a spec from ijson events, dropping the parts ``_reduce_spec`` strips.
+
+    ``components`` and non-2xx/3xx entries under ``paths.*.*.responses`` are
+    skipped token by token, so their values are never materialised.
+    """
+    builder = ijson.ObjectBuilder()
+    keys: list[str | None] = []  # current key per open container, None for arrays
+    skip_depth = 0
+    skip_value = False
+
+    for event, value in events:
+        if skip_depth:
+            if event in ("start_map", "start_array"):
+                skip_depth += 1
+            elif event in ("end_map", "end_array"):
+                skip_depth -= 1
+            continue
+        if skip_value:
+            skip_value = False
+            if event in ("start_map", "start_array"):
+                skip_depth = 1
+            continue
+
+        if event == "map_key":
+            depth = len(keys)
+            if (depth == 1 and value == "components") or (
+                depth == 5
+                and keys[0] == "paths"
+                and keys[3] == "responses"
+                and not _keep_response(value)
+            ):
+                skip_value = True
+                continue
+            keys[-1] = value
+        elif event == "start_map":
+            keys.append("")
+        elif event == "start_array":
+            keys.append(None)
+        elif event in ("end_map", "end_array"):
+            keys.pop()
+        builder.event(event, value)
+
+    return builder.value
+
+
 # --------------------------------------------------------------------------- #
 #                               Driver                                        #
 # --------------------------------------------------------------------------- #
@@ -63,6 +245,8 @@ class RestHttpDriver(MCSDriver):
         custom_driver_system_message: str | None = None,
     ) -> None:
         self.function_desc_urls = urls
+        parsed = urlparse(urls[0])
+        self._fallback_base = f"{parsed.scheme}://{parsed.netloc}"  # used when the spec has no servers
         self.reduced_spec = reduced_spec
         self.default_headers: dict[str, str] = default_headers or {}
         self.verify_ssl = verify_ssl
@@ -80,13 +264,46 @@ class RestHttpDriver(MCSDriver):
         else:
             self.proxies: dict[str, str] | None = None
 
-        # basic auth header
-        if basic_user and basic_password:
-            token = base64.b64encode(f"{basic_user}:{basic_password}".encode()).decode()
-            self.default_headers.setdefault("Authorization", f"Basic {token}")
+        # basic auth; an explicit Authorization header (default or per call) still wins
+        self._basic_auth: tuple[str, str] | None = None
+        self._auth: HTTPBasicAuth | None = None
+        if basic_user and basic_password and "Authorization" not in self.default_headers:
+            self._basic_auth = (basic_user, basic_password)
+            self._auth = HTTPBasicAuth(basic_user, basic_password)
+
+        # one pooled keep-alive session for spec fetches and tool calls
+        self._session = requests.Session()
+        self._session.headers.update(self.default_headers)
+        if self.proxies:
+            self._session.proxies.update(self.proxies)
+        self._session.verify = self.verify_ssl
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,  # let raise_for_status() report the final response
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # spec, prompt and base URL caches, kept until clear_cache()
+        self._spec_cache: str | None = None
+        self._sysmsg_cache: str | None = None
+        self._base_url: str | None = None
+
+    # ----------------------------- Cache ---------------------------------- #
+    def clear_cache(self) -> None:
+        """Drop the cached spec, system prompt and base URL so the next access refetches them."""
+        self._spec_cache = None
+        self._sysmsg_cache = None
+        self._base_url = None
 
     # --------------------------- Helpers ---------------------------------- #
-    def _do_request(
+    def _send(
         self,
         method: str,
         url: str,
@@ -94,106 +311,178 @@ class RestHttpDriver(MCSDriver):
         params: Dict[str, Any] | None = None,
         json_body: Dict[str, Any] | None = None,
         headers: Dict[str, str] | None = None,
-    ) -> str:
-        merged = {**self.default_headers, **(headers or {})}
-        resp = requests.request(
+    ) -> requests.Response:
+        # session default headers are merged in by requests; passing None for an
+        # empty override skips that per-call header merge. verify and proxies are
+        # passed per request because environment settings (REQUESTS_CA_BUNDLE,
+        # HTTPS_PROXY, ...) would otherwise override the session-level values.
+        resp = self._session.request(
             method.upper(),
             url,
             params=params,
             json=json_body,
-            headers=merged,
+            headers=headers or None,
             timeout=15,
             verify=self.verify_ssl,
             proxies=self.proxies,
+            auth=None if _overrides_auth(headers) else self._auth,
         )
         resp.raise_for_status()
-        return resp.text
+        return resp
 
-    def _reduce_spec(self, spec_text: str) -> str:
-        """Optional: strip components and 4xx/5xx responses to keep the spec tiny."""
-        try:
-            spec = json.loads(spec_text)
-        except Exception:
-            return spec_text  # not JSON
+    def _do_request(self, method: str, url: str, **kwargs: Any) -> str:
+        """Send a request and return the decoded response text."""
+        return self._send(method, url, **kwargs).text
+
+    def _do_request_bytes(self, method: str, url: str, **kwargs: Any) -> bytes:
+        """Send a request and return the raw body, skipping charset detection."""
+        return self._send(method, url, **kwargs).content
 
+    def _load_spec(self, data: bytes, reduced: bool) -> Any:
+        """Parse a spec body once; with *reduced*, drop what :meth:`_reduce_spec` strips.
+
+        Raises ValueError if *data* is not JSON.
+        """
+        if not reduced:
+            return _parse_spec(data)
+        if orjson is None and ijson is not None:
+            try:
+                return _prune_spec_events(ijson.basic_parse(io.BytesIO(data), use_float=True))
+            except Exception:
+                pass  # not JSON, or e.g. an integer overflow in float mode: let the DOM path decide
+
+        spec = _parse_spec(data)
+        if not isinstance(spec, dict):
+            return spec
         spec.pop("components", None)
 
         for path_item in spec.get("paths", {}).values():
             for op in path_item.values():
                 if not isinstance(op, dict):
                     continue
-                responses = op.get("responses", {})
-                for code in list(responses):
-                    if not str(code).startswith(("2", "3")):
-                        responses.pop(code, None)
-        return json.dumps(spec)
+                responses = op.get("responses")
+                if responses:
+                    kept = {c: v for c, v in responses.items() if _keep_response(c)}
+                    if len(kept) != len(responses):
+                        op["responses"] = kept
+        return spec
+
+    def _reduce_spec(self, spec_text: str | bytes) -> str:
+        """Optional: strip components and 4xx/5xx responses to keep the spec tiny."""
+        data = spec_text.encode() if isinstance(spec_text, str) else spec_text
+        try:
+            return _dumps(self._load_spec(data, reduced=True))
+        except ValueError:
+            return _as_text(spec_text)  # not JSON
+
+    def _derive_base_url(self, spec: Any) -> str:
+        """Return the URL of ``servers[0]`` in the parsed *spec*, else scheme and host of the spec URL."""
+        try:
+            base = spec.get("servers", [{}])[0].get("url")
+        except Exception:
+            base = None
+        if not isinstance(base, str) or not base:
+            base = self._fallback_base
+        return base.rstrip("/")
 
     @staticmethod
     def _extract_json(raw: str) -> str | None:
         """Return first JSON object in `raw`, stripping markdown fences."""
         try:
-            if raw.strip().startswith("```"):
-                raw = re.sub(r"^```[^\n]*\n", "", raw.strip())
-                raw = re.sub(r"\n```$", "", raw)
-            match = re.search(r"\{.*\}", raw, re.S)
-            return match.group(0) if match else None
+            raw = raw.strip()
+            if raw.startswith("```"):
+                raw = _FENCE_CLOSE.sub("", _FENCE_OPEN.sub("", raw))
+            return _find_first_json_object(raw)
         except Exception as e:
             logging.error(f"Error extracting JSON: {e}")
             return None
 
     # --------------------------- Interface Implementation --------------------------------- #
     def get_function_description(self, model_name: str | None = None) -> str:
-        """Return OpenAPI (or custom) spec. Custom override wins."""
+        """Return OpenAPI (or custom) spec. Custom override wins.
+
+        The spec is fetched once and cached; call :meth:`clear_cache` to refetch.
+        """
         if self._custom_tool_description is not None:
             return self._custom_tool_description
 
-        spec_text = self._do_request("GET", self.function_desc_urls[0])
-        return self._reduce_spec(spec_text) if self.reduced_spec else spec_text
+        if self._spec_cache is None:
+            # parse the raw body; only the final description is decoded to str
+            raw = self._do_request_bytes("GET", self.function_desc_urls[0])
+            try:
+                spec = self._load_spec(raw, self.reduced_spec)
+            except ValueError:
+                spec = None  # not JSON: served as-is, base URL from the spec URL
+            self._base_url = self._derive_base_url(spec)
+            if self.reduced_spec and spec is not None:
+                self._spec_cache = _dumps(spec)
+            else:
+                self._spec_cache = _as_text(raw)
+        return self._spec_cache
 
     def get_driver_system_message(self, model_name: str | None = None) -> str:
         """Return system prompt. Custom override wins."""
         if self._custom_system_message is not None:
             return self._custom_system_message
 
-        description = self.get_function_description(model_name)
-        return (
-            "You are a helpful assistant with access to these tools:\n\n"
-            f"{description}\n\n"
-            "When you need a tool, respond ONLY with JSON:\n"
-            '{ "path": "...", "arguments": { ... } }\n'
-        )
+        # the description does not depend on model_name, so one cached prompt serves all
+        if self._sysmsg_cache is None:
+            description = self.get_function_description(model_name)
+            self._sysmsg_cache = _SYSMSG_PREFIX + description + _SYSMSG_SUFFIX
+        return self._sysmsg_cache
 
     def process_llm_response(self, llm_response: str) -> str:
         """Parse the LLM JSON, call the endpoint, return raw result text."""
+        call = self._parse_call(llm_response)
+        if call is None:
+            return llm_response  # treat as plain text
+
+        method, url, kwargs = self._prepare_call(call)
+        return self._do_request(method, url, **kwargs)
+
+    # --------------------------- Call Handling ---------------------------- #
+    def _parse_call(self, llm_response: str) -> dict[str, Any] | None:
+        """Return the tool call emitted by the LLM, or None for plain text."""
+        start = _LEADING_WS.match(llm_response).end()
+        if llm_response.startswith("{", start):
+            try:
+                call, _ = _JSON_DECODER.raw_decode(llm_response, start)
+                return call if call.get("path") else None
+            except ValueError:
+                pass  # not a clean object, fall back to extraction
+
         json_block = self._extract_json(llm_response)
         if not json_block:
-            return llm_response  # treat as plain text
+            return None
 
         try:
-            call = json.loads(json_block)
-        except json.JSONDecodeError:
-            return llm_response
+            call = _JSON_DECODER.decode(json_block)
+        except ValueError:
+            return None
+        return call if call.get("path") else None
 
-        path = call.get("path")
+    def _resolve_base_url(self) -> str:
+        """Return the tool base URL, fetching the spec on first use if needed."""
+        # the base URL is resolved once, while the spec is fetched
+        if self._base_url is None:
+            if self._custom_tool_description is not None:
+                try:
+                    spec = _parse_spec(self._custom_tool_description.encode())
+                except ValueError:
+                    spec = None
+                self._base_url = self._derive_base_url(spec)
+            else:
+                self.get_function_description()
+        return self._base_url
+
+    def _prepare_call(self, call: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+        """Resolve a parsed tool call to ``(method, url, request kwargs)``."""
+        path = call["path"]
         method = call.get("method", "GET").upper()
         args = call.get("arguments", {}) or {}
         headers = call.get("headers", {}) or {}
-        if not path:
-            return llm_response
-
-        # derive base URL from spec "servers" or spec URL itself
-        if not hasattr(self, "_base_url"):
-            try:
-                spec_json = json.loads(self.get_function_description())
-                base = spec_json.get("servers", [{}])[0].get("url")
-            except Exception:
-                base = None
-            if not base:
-                parsed = urlparse(self.function_desc_urls[0])
-                base = f"{parsed.scheme}://{parsed.netloc}"
-            self._base_url = base.rstrip("/")
 
-        full_url = urljoin(self._base_url + "/", path.lstrip("/"))
+        full_url = self._resolve_base_url() + "/" + path.lstrip("/")
         if method == "GET":
-            return self._do_request("GET", full_url, params=args, headers=headers)
-        return self._do_request("POST", full_url, json_body=args, headers=headers)
+            return "GET", full_url, {"params": args, "headers": headers}
+        return "POST", full_url, {"json_body": args, "headers": headers}
@@ -1,4 +1,6 @@
 # mcs/examples/fastapi_rest_quickstart.py
+from functools import lru_cache
+
 from fastapi import FastAPI, Query
 from pydantic import BaseModel
 
@@ -13,13 +15,27 @@ class FibonacciResponse(BaseModel):
     result: int
 
 
+def _fib_pair(k: int) -> tuple[int, int]:
+    """Fast doubling: liefert (F(k), F(k+1)) in O(log k) Schritten."""
+    if k == 0:
+        return 0, 1
+    a, b = _fib_pair(k >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if k & 1 else (c, d)
+
+
+@lru_cache(maxsize=1024)
 def fib(n: int) -> int:
-    if n < 2:
-        return 1
-    a, b = 1, 1
-    for _ in range(n - 1):
-        a, b = b, a + b
-    return b
+    # fib(0) = fib(1) = 1, d.h. F(n+1)
+    return _fib_pair(n)[1]
+
+
+# Obergrenze für n: hält die gecachten Ergebnisse klein (F(10000) hat ~2100 Stellen)
+_MAX_N = 10_000
+
+# häufig abgefragte kleine n vorab berechnen
+_PRECOMPUTED = tuple(fib(i) for i in range(65))
 
 
 # OpenAPI-Spec liegt automatisch unter /openapi.json  (FastAPI-Standard)
@@ -30,13 +46,14 @@ def fib(n: int) -> int:
     tags=["Tools"],
     summary="Die berechnete Fibonacci-Zahl",
 )
-async def get_fibonacci(
-    n: int = Query(..., ge=0, description="Position in der Fibonacci-Sequenz"),
+def get_fibonacci(
+    n: int = Query(..., ge=0, le=_MAX_N, description="Position in der Fibonacci-Sequenz"),
 ):
     """
     Liefert `fib(n)` als JSON.
     """
-    return {"result": 2 * fib(n)}
+    result = _PRECOMPUTED[n] if n < len(_PRECOMPUTED) else fib(n)
+    return {"result": 2 * result}
 
 
 def main() -> None:
@@ -1,5 +1,9 @@
-from fastapi import FastAPI, Query
-from fastapi.responses import HTMLResponse
+import hashlib
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import HTMLResponse, Response
 from fastapi.openapi.utils import get_openapi
 import json
 from pydantic import BaseModel
@@ -15,17 +19,33 @@ class FibonacciResponse(BaseModel):
     result: str
 
 
+def _fib_pair(k: int) -> tuple[int, int]:
+    """Fast doubling: liefert (F(k), F(k+1)) in O(log k) Schritten."""
+    if k == 0:
+        return 0, 1
+    a, b = _fib_pair(k >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if k & 1 else (c, d)
+
+
+@lru_cache(maxsize=1024)
 def fibonacci(n: int) -> int:
     if n <= 1:
         return max(0, n)
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    return _fib_pair(n)[0]
 
 
-@app.get("/openapi-html", response_class=HTMLResponse)
-async def openapi_as_html():
+# Obergrenze für n: hält die gecachten Ergebnisse klein (F(10000) hat ~2100 Stellen)
+_MAX_N = 10_000
+
+# häufig abgefragte kleine n vorab berechnen
+_PRECOMPUTED = tuple(fibonacci(i) for i in range(65))
+
+
+@lru_cache(maxsize=1)
+def _openapi_html() -> tuple[bytes, str]:
+    """Rendert die (nach dem Start unveränderliche) Spezifikation einmalig als HTML + ETag."""
     spec = get_openapi(
         title=app.title,
         version=app.version,
@@ -41,15 +61,36 @@ async def openapi_as_html():
         </body>
     </html>
     """
-    return HTMLResponse(content=html)
+    body = html.encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return body, etag
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Schwacher Vergleich nach RFC 9110: Liste, optionales ``W/`` und ``*``."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@app.get("/openapi-html", response_class=HTMLResponse)
+async def openapi_as_html(request: Request):
+    body, etag = _openapi_html()
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return HTMLResponse(content=body, headers={"ETag": etag})
 
 
 # HTML-Endpunkt für Browser
 @app.get("/tools/fibonacci", response_class=HTMLResponse, tags=["Tools"])
-async def get_fibonacci_html(
-    n: int = Query(..., description="Die Position in der Fibonacci-Sequenz. Nur positive ganze Zahlen erlaubt.")
+def get_fibonacci_html(
+    n: int = Query(..., le=_MAX_N, description="Die Position in der Fibonacci-Sequenz. Nur positive ganze Zahlen erlaubt.")
 ):
-    result = fibonacci(n)
+    result = _PRECOMPUTED[n] if 0 <= n < len(_PRECOMPUTED) else fibonacci(n)
     result = 2 * result
     html = f"<html><body><h1>Ergebnis: {result}</h1></body></html>"
     return HTMLResponse(content=html, status_code=200)